@@ -1,15 +1,21 @@
 from __future__ import annotations
 
+import dataclasses
 import datetime as dt
+import hashlib
+import logging
 import os
 import tempfile
-from contextlib import contextmanager
+import threading
+from collections import OrderedDict
 from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Iterator
+from typing import Any, Dict
 
+import diskcache
 import yaml
-from mlflow.deployments import get_deploy_client
+from mlflow.deployments import BaseDeploymentClient, get_deploy_client
+from mlflow.entities.model_registry import ModelVersion
 from mlflow.tracking import MlflowClient
 from mlflow.tracking.artifact_utils import _download_artifact_from_uri
 from yarl import URL
@@ -17,88 +23,196 @@ from yarl import URL
 from modules.resources import ModelInfo, ModelStage, TritonServerInfo
 
 
+logger = logging.getLogger(__name__)
+
+
+try:  # LibYAML bindings are much faster than the pure-Python parser
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader  # type: ignore[assignment]
+
+
+REGISTRY_STAGES = ("staging", "production")
+MLMODEL_CACHE_TTL = 3600  # seconds
+TRITON_CLIENTS_PER_THREAD = 8
+
+MLMODEL_CACHE_DIR = Path(
+    os.environ.get(
+        "MLMODEL_CACHE_DIR", os.path.join(tempfile.gettempdir(), "mlmodel_cache")
+    )
+)
+
+_mlmodel_cache = diskcache.Cache(str(MLMODEL_CACHE_DIR / "parsed"))
+_mlmodel_files_dir = MLMODEL_CACHE_DIR / "files"
+
+
+@lru_cache(maxsize=1)
+def _get_mlflow_client() -> MlflowClient:
+    # Shared by all connectors, Streamlit reruns would otherwise rebuild it
+    return MlflowClient()  # URI and token are passed via env vars
+
+
+_triton_env_lock = threading.Lock()
+_triton_clients = threading.local()
+
+
+def _get_triton_client(triton_url: str, model_repo: str) -> BaseDeploymentClient:
+    # The plugin wraps tritonclient's InferenceServerClient, which is not
+    # thread-safe, so clients are reused only within the thread that created them.
+    # Only listings benefit: they run in the long-lived asyncio.to_thread workers,
+    # while deploys run on Streamlit script threads, which are new on every rerun.
+    # Servers come and go, so each thread keeps just the recently used clients.
+    clients: OrderedDict[tuple[str, str], BaseDeploymentClient] | None = getattr(
+        _triton_clients, "clients", None
+    )
+    if clients is None:
+        clients = _triton_clients.clients = OrderedDict()
+    key = (triton_url, model_repo)
+    if key in clients:
+        clients.move_to_end(key)
+    else:
+        clients[key] = _create_triton_client(triton_url, model_repo)
+        if len(clients) > TRITON_CLIENTS_PER_THREAD:
+            clients.popitem(last=False)
+    return clients[key]
+
+
+def _create_triton_client(triton_url: str, model_repo: str) -> BaseDeploymentClient:
+    # The Triton plugin takes its server config only from TRITON_URL and
+    # TRITON_MODEL_REPO, and reads them once while the client is constructed.
+    # Env vars are therefore set just for the construction (under a lock,
+    # since they are process-global).
+    with _triton_env_lock:
+        old_env = {
+            name: os.environ.get(name) for name in ("TRITON_URL", "TRITON_MODEL_REPO")
+        }
+        os.environ["TRITON_URL"] = triton_url
+        os.environ["TRITON_MODEL_REPO"] = model_repo
+        try:
+            return get_deploy_client("triton")
+        finally:
+            for name, value in old_env.items():
+                if value is None:
+                    os.environ.pop(name, None)
+                else:
+                    os.environ[name] = value
+
+
 class MLFlowConnector:
     def __init__(self) -> None:
-        self.client = MlflowClient()  # URI and token are passed via env vars
+        self.client = _get_mlflow_client()
         self._mlflow_uri = os.environ["MLFLOW_TRACKING_URI"]
         self._public_mlflow_uri = os.environ.get("MLFLOW_PUBLIC_URI", self._mlflow_uri)
+        # Model pages live in the fragment of the MLflow UI URL,
+        # so links are derived from pre-parsed bases without re-parsing
+        self._link_base = URL(
+            f"{self.client._tracking_client.tracking_uri.rstrip('/')}/"
+        )
+        self._public_link_base = URL(f"{self._public_mlflow_uri.rstrip('/')}/")
 
     def get_registered_models(self) -> list[ModelStage]:
-        registered_models = self.client.search_registered_models()
+        # Fetching MLmodel definitions costs an artifact download per version,
+        # so they are left out here, see load_model_config
+        model_versions = self._get_latest_stage_versions()
+
         result = []
-        for model in registered_models:
-            model_versions = self.client.get_latest_versions(
-                model.name, stages=["staging", "production"]
+        for model_version in model_versions:
+            model_fragment = (
+                f"/models/{model_version.name}/versions/{model_version.version}"
             )
-            for model_version in model_versions:
-                model_stage_record = ModelStage(
-                    name=model.name,
-                    version=model_version.version,
-                    stage=model_version.current_stage or "",
-                    creation_datetime=dt.datetime.fromtimestamp(
-                        model_version.creation_timestamp
-                        / 1000  # stored in milliseconds
-                    ),
-                    link=URL(
-                        f"{self.client._tracking_client.tracking_uri}"
-                        f"/#/models/{model.name}/versions/{model_version.version}"
-                    ),
-                    public_link=URL(
-                        f"{self._public_mlflow_uri}"
-                        f"/#/models/{model.name}/versions/{model_version.version}"
-                    ),
-                    uri=URL(f"models:/{model.name}/{model_version.current_stage}"),
-                    source=model_version.source,
-                    mlmodel_definition=(self.get_model_config(model_version.source)),
-                )
-                result.append(model_stage_record)
+            model_stage_record = ModelStage(
+                name=model_version.name,
+                version=model_version.version,
+                stage=model_version.current_stage or "",
+                creation_datetime=dt.datetime.fromtimestamp(
+                    model_version.creation_timestamp / 1000  # stored in milliseconds
+                ),
+                link=self._link_base.with_fragment(model_fragment),
+                public_link=self._public_link_base.with_fragment(model_fragment),
+                # built from the raw string, since yarl path segments would
+                # percent-encode characters that are part of the model name
+                uri=URL(f"models:/{model_version.name}/{model_version.current_stage}"),
+                source=model_version.source,
+            )
+            result.append(model_stage_record)
         return result
 
-    @lru_cache
+    def get_registry_etag(self) -> str:
+        # Creating, transitioning or deleting a model version also updates
+        # its registered model, so the most recent update reflects version
+        # changes with a single-row query. Removing a whole registered model
+        # leaves the others untouched and is not reflected.
+        registered_models = self.client.search_registered_models(
+            max_results=1, order_by=["last_updated_timestamp DESC"]
+        )
+        if not registered_models:
+            return ""
+        latest = registered_models[0]
+        return f"{latest.name}:{latest.last_updated_timestamp}"
+
+    def load_model_config(self, model: ModelStage) -> ModelStage:
+        if model.mlmodel_definition is not None or not model.source:
+            return model
+        return dataclasses.replace(
+            model, mlmodel_definition=self.get_model_config(model.source)
+        )
+
+    def _get_latest_stage_versions(self) -> list[ModelVersion]:
+        # A single search over all versions replaces listing registered models
+        # and then asking for the latest versions of each one separately
+        latest: dict[tuple[str, str], ModelVersion] = {}
+        page_token = None
+        while True:
+            page = self.client.search_model_versions(page_token=page_token)
+            for model_version in page:
+                stage = model_version.current_stage or ""
+                if stage.lower() not in REGISTRY_STAGES:
+                    continue
+                key = (model_version.name, stage)
+                current = latest.get(key)
+                if current is None or int(model_version.version) > int(current.version):
+                    latest[key] = model_version
+            page_token = page.token
+            if not page_token:
+                break
+        return [latest[key] for key in sorted(latest)]
+
     def get_model_config(self, model_source: str) -> Dict[str, Any]:
-        print("Debug: calling get_model_config")
-        mlmodel_path = os.path.join(model_source, "MLmodel")
-        with tempfile.TemporaryDirectory() as tmpdirname:
-            model_config_path = Path(
-                _download_artifact_from_uri(mlmodel_path, tmpdirname)
+        # Registered model version sources are immutable,
+        # so a parsed MLmodel can be kept across app restarts
+        cached = _mlmodel_cache.get(model_source)
+        if cached is not None:
+            return cached
+        return self._fetch_model_config(model_source)
+
+    def _fetch_model_config(self, model_source: str) -> Dict[str, Any]:
+        logger.debug("Fetching MLmodel for %s", model_source)
+        # Downloaded files are kept in a per-source directory
+        # and reused once the parsed entry expires
+        model_dir = _mlmodel_files_dir / hashlib.sha1(model_source.encode()).hexdigest()
+        model_config_path = model_dir / "MLmodel"
+        if not model_config_path.exists():
+            model_dir.mkdir(parents=True, exist_ok=True)
+            _download_artifact_from_uri(
+                os.path.join(model_source, "MLmodel"), str(model_dir)
             )
+        try:
             with open(model_config_path) as f:
-                return yaml.safe_load(f)
-
-    @contextmanager
-    def set_triton_server_cofig(
+                model_config = yaml.load(f, Loader=SafeLoader)
+        except Exception:
+            model_config_path.unlink(missing_ok=True)  # re-download next time
+            raise
+        _mlmodel_cache.set(model_source, model_config, expire=MLMODEL_CACHE_TTL)
+        return model_config
+
+    def get_triton_client(
         self, triton_server_config: TritonServerInfo
-    ) -> Iterator[None]:
-        # Tricky one, model_repository_path
-        # should be shared between
-        # the machine where the deployment is triggered
-        # and the Triton server machine
-        # This is because to deploy model in Triton, one should
-        # (1) copy its files to triton server (no API exposed for that)
-        # (2) trigger model load via triton server API
-        assert triton_server_config.model_repository_path.exists()
-
-        old_triton_url = os.environ.get("TRITON_URL")
-        old_triton_model_repo = os.environ.get("TRITON_MODEL_REPO")
-
-        os.environ["TRITON_URL"] = (
+    ) -> BaseDeploymentClient:
+        return _get_triton_client(
             f"http://{triton_server_config.internal_hostname}:"
-            f"{triton_server_config.port}"
+            f"{triton_server_config.port}",
+            str(triton_server_config.model_repository_path),
         )
-        os.environ["TRITON_MODEL_REPO"] = str(
-            triton_server_config.model_repository_path
-        )
-        yield
-
-        if old_triton_url:
-            os.environ["TRITON_URL"] = old_triton_url
-        else:
-            os.environ.pop("TRITON_URL")
-
-        if old_triton_model_repo:
-            os.environ["TRITON_MODEL_REPO"] = old_triton_model_repo
-        else:
-            os.environ.pop("TRITON_MODEL_REPO")
 
     def deploy_triton(
         self,
@@ -107,35 +221,31 @@ class MLFlowConnector:
         flavor: str,
         triton_server_config: TritonServerInfo,
     ) -> None:
-        with self.set_triton_server_cofig(triton_server_config):
-            deploy_client = get_deploy_client("triton")
-            deployment: dict = deploy_client.create_deployment(  # type: ignore
-                name=deployment_name,
-                model_uri=str(model.uri),
-                flavor=flavor,
-            )
-            if deployment.get("name", "") != deployment_name:
-                raise RuntimeError(f"Deployment failed: {deployment_name}")
+        deploy_client = self.get_triton_client(triton_server_config)
+        deployment: dict = deploy_client.create_deployment(  # type: ignore
+            name=deployment_name,
+            model_uri=str(model.uri),
+            flavor=flavor,
+        )
+        if deployment.get("name", "") != deployment_name:
+            raise RuntimeError(f"Deployment failed: {deployment_name}")
 
-            # TODO: monitor API is ready
+        # TODO: monitor API is ready
 
     def list_triton_deployments(
         self,
         triton_server_config: TritonServerInfo,
     ) -> list[ModelInfo]:
-        assert triton_server_config.model_repository_path.exists()
-
-        with self.set_triton_server_cofig(triton_server_config):
-            deploy_client = get_deploy_client("triton")
-            triton_models = list(deploy_client.list_deployments())
-            results = []
-            for model in triton_models:
-                results.append(
-                    ModelInfo(
-                        name=model["name"],
-                        # URI is in form models:/<model-name>/<model-stage>
-                        stage=model["mlflow_model_uri"].split("/")[-1],
-                        version="unknown",
-                    )
+        deploy_client = self.get_triton_client(triton_server_config)
+        triton_models = list(deploy_client.list_deployments())
+        results = []
+        for model in triton_models:
+            results.append(
+                ModelInfo(
+                    name=model["name"],
+                    # URI is in form models:/<model-name>/<model-stage>
+                    stage=model["mlflow_model_uri"].rpartition("/")[2],
+                    version="unknown",
                 )
-            return results
+            )
+        return results
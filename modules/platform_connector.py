@@ -4,8 +4,21 @@ import asyncio
 import logging
 import os
 import re
+import threading
+import weakref
+from collections import defaultdict
 from pathlib import Path
-from typing import Any, Coroutine
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Coroutine,
+    Hashable,
+    Iterable,
+    Protocol,
+    Sequence,
+    TypeVar,
+)
 
 from apolo_sdk import (
     Client,
@@ -17,8 +30,13 @@ from apolo_sdk import (
     Volume,
     get,
 )
+from cachetools import TLRUCache
 from requests import ConnectionError, request
 from streamlit.delta_generator import DeltaGenerator
+from streamlit.runtime.scriptrunner import add_script_run_ctx
+from streamlit.runtime.scriptrunner_utils.script_run_context import (
+    SCRIPT_RUN_CONTEXT_ATTR_NAME,
+)
 from yarl import URL
 
 from modules.mlflow_connector import MLFlowConnector
@@ -35,45 +53,231 @@ from modules.resources import (
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 
-GH_SUPPORTED_IMAGES = [
+GH_SUPPORTED_IMAGES: tuple[RemoteImage, ...] = (
     RemoteImage(name="ghcr.io/neuro-inc/mlflow"),
     RemoteImage(name="ghcr.io/neuro-inc/base"),
-]
+)
 
 
-NVCR_SUPPORTED_IMAGES = [
+NVCR_SUPPORTED_IMAGES: tuple[RemoteImage, ...] = (
     RemoteImage(name="nvcr.io/nvidia/tritonserver"),
-]
+)
+NVCR_ONNX_TAG_RE = re.compile(r"\d{1,2}\.\d{1,2}-py3")
+
+INFERENCE_SERVER_TAG = "in-job-deployments::inference-server"
+SERVER_TYPE_TAG_KEY = "server-type"
+SERVER_TYPE_TAG_PREFIX = f"{SERVER_TYPE_TAG_KEY}::"
+MODEL_INFO_TAG_KEY = "model-info"
+MODEL_INFO_TAG_PREFIX = f"{MODEL_INFO_TAG_KEY}::"
+
+JOB_STATUS_POLL_MIN_DELAY = 0.1  # seconds
+JOB_STATUS_POLL_MAX_DELAY = 2.0  # seconds
+JOB_STATUS_POLL_BACKOFF = 1.5
+JOB_PENDING_TIMEOUT = 900  # seconds
+# Statuses covered by JobStatus.is_pending, e.g. also SUSPENDED
+PENDING_JOB_STATUSES = frozenset(status for status in JobStatus if status.is_pending)
+LOOP_SHUTDOWN_TIMEOUT = 5  # seconds
+
+PRESETS_CACHE_TTL = 300  # seconds
+IMAGES_CACHE_TTL = 120  # seconds
+IMAGE_TAGS_CACHE_TTL = 120  # seconds
+IMAGE_TAGS_ERROR_CACHE_TTL = 5  # seconds
+IMAGE_TAGS_TIMEOUT = 30  # seconds
+
+# Values are stored as (ttl, value) pairs, so every entry expires on its own TTL
+_platform_cache: TLRUCache[tuple[Hashable, ...], tuple[float, Any]] = TLRUCache(
+    maxsize=128, ttu=lambda _key, value, now: now + value[0]
+)
+_platform_cache_lock = threading.Lock()
+
+
+def _get_cached(key: tuple[Hashable, ...]) -> tuple[float, Any] | None:
+    with _platform_cache_lock:
+        return _platform_cache.get(key)
+
+
+def _run_event_loop(loop: asyncio.AbstractEventLoop) -> None:
+    asyncio.set_event_loop(loop)
+    try:
+        loop.run_forever()
+    finally:
+        loop.close()
+
+
+class _Closeable(Protocol):
+    async def close(self) -> None:
+        ...
+
+
+def _stop_event_loop(
+    loop: asyncio.AbstractEventLoop,
+    loop_thread: threading.Thread,
+    closeables: list[_Closeable],
+) -> None:
+    async def shutdown() -> None:
+        await asyncio.gather(
+            *(closeable.close() for closeable in closeables), return_exceptions=True
+        )
+
+    if loop.is_closed():
+        return
+    future = asyncio.run_coroutine_threadsafe(shutdown(), loop)
+    future.add_done_callback(lambda _: loop.call_soon_threadsafe(loop.stop))
+    if threading.current_thread() is not loop_thread:
+        # Wait for connections to be closed, e.g. on interpreter exit
+        try:
+            future.result(timeout=LOOP_SHUTDOWN_TIMEOUT)
+        except Exception as e:
+            logger.warning(f"Unable to shut down event loop cleanly: {e}")
+
+
+class _PlatformClientHolder:
+    # A single platform client is kept for the lifetime of the runner,
+    # so config loading and connection setup are paid only once.
+    # Kept apart from the runner: the loop finalizer must not refer to it.
+    def __init__(self, closeables: list[_Closeable]) -> None:
+        self._closeables = closeables
+        self._client: Client | None = None
+        self._lock = asyncio.Lock()
+
+    async def get(self) -> Client:
+        async with self._lock:
+            if self._client is None:
+                self._client = await get()
+                self._closeables.append(self._client)
+            return self._client
+
+
+class PendingJobWaiter:
+    # Waits for jobs to leave the pending state. Concurrent waits are coalesced:
+    # a single poller lists all pending jobs with the given tags once per tick,
+    # instead of every caller polling the status of its own job.
+    def __init__(
+        self, get_client: Callable[[], Awaitable[Client]], tags: list[str]
+    ) -> None:
+        self._get_client = get_client
+        self._tags = tags
+        self._pending: dict[str, asyncio.Future[JobDescription]] = {}
+        self._waiters: defaultdict[str, int] = defaultdict(int)
+        self._poller: asyncio.Task[None] | None = None
+
+    async def wait(self, job_descr: JobDescription) -> JobDescription:
+        if not job_descr.status.is_pending:
+            return job_descr
+        job_id = job_descr.id
+        if job_id not in self._pending:
+            self._pending[job_id] = asyncio.get_running_loop().create_future()
+        future = self._pending[job_id]
+        if self._poller is None or self._poller.done():
+            self._poller = asyncio.create_task(self._poll())
+        self._waiters[job_id] += 1
+        try:
+            # Shielded, so that a cancelled waiter does not affect the others
+            return await asyncio.shield(future)
+        finally:
+            self._waiters[job_id] -= 1
+            if not self._waiters[job_id]:
+                del self._waiters[job_id]
+                self._pending.pop(job_id, None)
+
+    async def _poll(self) -> None:
+        # The SDK exposes no job status stream, so poll with exponential backoff:
+        # quickly scheduled jobs are still noticed fast,
+        # while slow ones do not flood the API with requests
+        delay = JOB_STATUS_POLL_MIN_DELAY
+        while self._pending:
+            await asyncio.sleep(delay)
+            delay = min(delay * JOB_STATUS_POLL_BACKOFF, JOB_STATUS_POLL_MAX_DELAY)
+            try:
+                await self._resolve_started_jobs()
+            except Exception as e:
+                logger.warning(f"Unable to fetch pending jobs status: {e}")
+
+    async def _resolve_started_jobs(self) -> None:
+        n_client = await self._get_client()
+        still_pending = {
+            job_descr.id
+            async for job_descr in n_client.jobs.list(
+                statuses=set(PENDING_JOB_STATUSES), tags=self._tags
+            )
+        }
+        for job_id in [x for x in self._pending if x not in still_pending]:
+            job_descr = await n_client.jobs.status(job_id)
+            if job_descr.status.is_pending:
+                continue  # listed just before it was scheduled
+            future = self._pending.pop(job_id, None)
+            if future is not None and not future.done():
+                future.set_result(job_descr)
+
+    async def close(self) -> None:
+        if self._poller is not None:
+            self._poller.cancel()
 
 
 class InferenceRunner:
     def __init__(self, mlflow_connector: MLFlowConnector) -> None:
-        self._client: Client | None = None
         self._mlflow_connector = mlflow_connector
+        self._reset_loop_state()
+
+    @property
+    def mlflow_connector(self) -> MLFlowConnector:
+        return self._mlflow_connector
+
+    def _reset_loop_state(self) -> None:
+        # Everything here is bound to the event loop the runner owns
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_thread: threading.Thread | None = None
+        self._finalizer: weakref.finalize | None = None
+        self._closeables: list[_Closeable] = []
+        self._client_holder = _PlatformClientHolder(self._closeables)
+        self._registry_clients: dict[str, RegistryV2Client] = {}
+        # Closeables are finalizer arguments, so the waiter gets the client
+        # from the holder rather than through a method bound to the runner
+        self._job_waiter = PendingJobWaiter(
+            self._client_holder.get, self.get_server_tags()
+        )
+        self._closeables.append(self._job_waiter)
+        self._cache_locks: defaultdict[
+            tuple[Hashable, ...], asyncio.Lock
+        ] = defaultdict(asyncio.Lock)
+
+    async def _get_client(self) -> Client:
+        return await self._client_holder.get()
 
     def get_server_tags(
         self,
         inference_type: InferenceServerType | None = None,
         model: ModelStage | None = None,
     ) -> list[str]:
-        result = [f"in-job-deployments::inference-server"]
+        result = [INFERENCE_SERVER_TAG]
         if inference_type:
-            result.append(f"server-type::{inference_type.value}")
+            result.append(f"{SERVER_TYPE_TAG_PREFIX}{inference_type.value}")
         if model:
-            result.append(f"model-info::{model.name}:{model.stage}:{model.version}")
+            result.append(
+                f"{MODEL_INFO_TAG_PREFIX}{model.name}:{model.stage}:{model.version}"
+            )
         return result
 
+    @staticmethod
+    def _find_tag_value(tags: Iterable[str], prefix: str) -> str | None:
+        for tag in tags:
+            if tag.startswith(prefix):
+                return tag[len(prefix) :]
+        return None
+
     def get_inference_server_type(
         self,
         job_description: JobDescription,
     ) -> InferenceServerType:
-        tags = job_description.tags
-        for tag in tags:
-            if "server-type::" in tag:
-                _, server_type = tag.split("::")
-                return InferenceServerType(server_type)
-        raise ValueError(f"Server info not found in job {job_description.id}")
+        # Runs on raw listed jobs before any server info exists,
+        # so a short-circuiting scan is cheaper than building the tag map
+        server_type = self._find_tag_value(job_description.tags, SERVER_TYPE_TAG_PREFIX)
+        if server_type is None:
+            raise ValueError(f"Server info not found in job {job_description.id}")
+        return InferenceServerType(server_type)
 
     def get_mlflow_model_info(
         self,
@@ -81,30 +285,28 @@ class InferenceRunner:
     ) -> DeployedModelInfo:
         assert server_info.type == InferenceServerType.MLFLOW
 
-        for tag in server_info.job_tags:
-            if "model-info::" in tag:
-                _, model_info_tag = tag.split("::")
-                name, stage, version = model_info_tag.split(":")
-                model_info = ModelInfo(
-                    name=name,
-                    stage=stage,
-                    version=version,
-                )
-                return DeployedModelInfo(
-                    model_info=model_info,
-                    inference_server_info=InferenceServerInfo(
-                        job_description=server_info.job_description,
-                        type=InferenceServerType.MLFLOW,
-                    ),
-                )
-        raise ValueError(f"Model info not found in job {server_info.job_id}")
+        model_info_tag = server_info.tag_map.get(MODEL_INFO_TAG_KEY)
+        if model_info_tag is None:
+            raise ValueError(f"Model info not found in job {server_info.job_id}")
+        # only the model name may contain colons
+        name, stage, version = model_info_tag.rsplit(":", 2)
+        model_info = ModelInfo(
+            name=name,
+            stage=stage,
+            version=version,
+        )
+        return DeployedModelInfo(
+            model_info=model_info,
+            inference_server_info=server_info,
+        )
 
     def get_triton_model_infos(
         self,
         server_info: InferenceServerInfo,
     ) -> list[DeployedModelInfo]:
         assert server_info.type == InferenceServerType.TRITON
-        server_config = TritonServerInfo(server_info.job_description)
+        server_config = self._get_triton_server_config(server_info)
+        server_config.check_model_repository()
 
         model_infos = self._mlflow_connector.list_triton_deployments(server_config)
         result = [
@@ -113,6 +315,25 @@ class InferenceRunner:
 
         return result
 
+    def _make_server_info(
+        self, job_descr: JobDescription, server_type: InferenceServerType
+    ) -> InferenceServerInfo:
+        if server_type == InferenceServerType.TRITON:
+            try:
+                return TritonServerInfo(job_description=job_descr)
+            except ValueError as e:
+                # still listed, so that the server can be terminated
+                logger.warning(f"Unable to fetch server config: {e}")
+        return InferenceServerInfo(job_description=job_descr, type=server_type)
+
+    def _get_triton_server_config(
+        self, server_info: InferenceServerInfo
+    ) -> TritonServerInfo:
+        # Triton servers are listed as TritonServerInfo already
+        if isinstance(server_info, TritonServerInfo):
+            return server_info
+        return TritonServerInfo(server_info.job_description)
+
     def list_active_inference_servers(self) -> list[InferenceServerInfo]:
         return self.run_coroutine(self._list_active_inference_servers())
 
@@ -121,27 +342,62 @@ class InferenceRunner:
         server_type: InferenceServerType | None = None,
     ) -> list[InferenceServerInfo]:
         target_tags = self.get_server_tags(server_type)
-        async with get() as n_client:
-            result = []
-            async for job_descr in n_client.jobs.list(
-                statuses=JobStatus.active_items(),
-                tags=target_tags,
-            ):
-                try:
-                    server_type = self.get_inference_server_type(job_descr)
-                except ValueError as e:
-                    logger.warning(f"Unknown inference server type: {e}")
-                else:
-                    server_info = InferenceServerInfo(
-                        job_description=job_descr,
-                        type=server_type,
-                    )
-                    result.append(server_info)
-            return result
+        n_client = await self._get_client()
+        result = []
+        async for job_descr in n_client.jobs.list(
+            statuses=JobStatus.active_items(),
+            tags=target_tags,
+        ):
+            try:
+                server_type = self.get_inference_server_type(job_descr)
+            except ValueError as e:
+                logger.warning(f"Unknown inference server type: {e}")
+            else:
+                result.append(self._make_server_info(job_descr, server_type))
+        return result
 
-    async def list_preset_names(self) -> list[str]:
-        async with get() as n_client:
-            return list(n_client.config.presets.keys())
+    async def _cached(
+        self,
+        key: tuple[Hashable, ...],
+        ttl: float,
+        coro_factory: Callable[[], Awaitable[T]],
+    ) -> T:
+        async def fetch_entry() -> tuple[float, T]:
+            return ttl, await coro_factory()
+
+        return await self._cached_entry(key, fetch_entry)
+
+    async def _cached_entry(
+        self,
+        key: tuple[Hashable, ...],
+        entry_factory: Callable[[], Awaitable[tuple[float, T]]],
+    ) -> T:
+        # Presets, images and tags rarely change, while Streamlit asks for them
+        # on every rerun, so results are served from a module-level TTL cache.
+        # Concurrent misses of the same key wait for a single fetch.
+        if (entry := _get_cached(key)) is not None:
+            return entry[1]
+        async with self._cache_locks[key]:
+            if (entry := _get_cached(key)) is not None:
+                return entry[1]
+            entry = await entry_factory()
+            with _platform_cache_lock:  # shared by event loops of all sessions
+                _platform_cache[key] = entry
+            return entry[1]
+
+    def clear_cache(self) -> None:
+        # Drops cached presets, images and tags of all sessions
+        with _platform_cache_lock:
+            _platform_cache.clear()
+
+    async def list_preset_names(self) -> tuple[str, ...]:
+        return await self._cached(
+            ("presets",), PRESETS_CACHE_TTL, self._list_preset_names
+        )
+
+    async def _list_preset_names(self) -> tuple[str, ...]:
+        n_client = await self._get_client()
+        return tuple(n_client.config.presets)
 
     async def list_images(
         self,
@@ -149,49 +405,67 @@ class InferenceRunner:
         github: bool = False,
         platform: bool = False,
     ) -> list[RemoteImage]:
-        tasks = []
+        # Only platform images need a round-trip, the rest are constants
+        results: list[RemoteImage] = []
         if triton:
-            tasks.append(asyncio.create_task(self._list_triton_images()))
+            results.extend(NVCR_SUPPORTED_IMAGES)
         if github:
-            tasks.append(asyncio.create_task(self._list_gh_images()))
+            results.extend(GH_SUPPORTED_IMAGES)
         if platform:
-            tasks.append(asyncio.create_task(self._list_platform_images()))
-        results = []
-        for res in await asyncio.gather(*tasks):
-            results.extend(res)
+            results.extend(await self._list_platform_images())
         return results
 
-    async def _list_gh_images(self) -> list[RemoteImage]:
-        return GH_SUPPORTED_IMAGES
-
-    async def _list_triton_images(self) -> list[RemoteImage]:
-        return NVCR_SUPPORTED_IMAGES
+    async def _list_platform_images(self) -> Sequence[RemoteImage]:
+        return await self._cached(
+            ("platform_images",), IMAGES_CACHE_TTL, self._fetch_platform_images
+        )
 
-    async def _list_platform_images(self) -> list[RemoteImage]:
-        async with get() as n_client:
-            platform_images = await n_client.images.list(n_client.cluster_name)
-            return platform_images
+    async def _fetch_platform_images(self) -> Sequence[RemoteImage]:
+        n_client = await self._get_client()
+        platform_images = await n_client.images.list(n_client.cluster_name)
+        return platform_images
 
     async def list_image_tags(self, image: RemoteImage) -> list[RemoteImage]:
+        # Failed listings are briefly cached as empty ones too,
+        # so that a broken registry is not asked again on every rerun
+        return await self._cached_entry(
+            ("image_tags", str(image)), lambda: self._try_list_image_tags(image)
+        )
+
+    async def _try_list_image_tags(
+        self, image: RemoteImage
+    ) -> tuple[float, list[RemoteImage]]:
+        try:
+            tags = await asyncio.wait_for(
+                self._list_image_tags(image), IMAGE_TAGS_TIMEOUT
+            )
+        except Exception as e:
+            logger.error(f"Unable to fetch image tags for {image}: {e}")
+            return IMAGE_TAGS_ERROR_CACHE_TTL, []
+        return IMAGE_TAGS_CACHE_TTL, tags
+
+    def _get_registry_client(self, registry: str) -> RegistryV2Client:
+        if registry not in self._registry_clients:
+            registry_client = RegistryV2Client(base_url=URL("https://" + registry))
+            self._registry_clients[registry] = registry_client
+            self._closeables.append(registry_client)
+        return self._registry_clients[registry]
+
+    async def _list_image_tags(self, image: RemoteImage) -> list[RemoteImage]:
         if image._is_in_apolo_registry:
-            async with get() as n_client:
-                return list(await n_client.images.tags(image))
+            n_client = await self._get_client()
+            return list(await n_client.images.tags(image))
         else:
             reg, own, *repo = image.name.split("/")
-            reg_cl = RegistryV2Client(base_url=URL("https://" + reg))
-            try:
-                imgs_with_tags = await reg_cl.list_repo_tags(own, "/".join(repo))
-                imgs_with_tags = imgs_with_tags[::-1]  # From older to newer
-                if image in NVCR_SUPPORTED_IMAGES:
-                    reg = r"\d{1,2}\.\d{1,2}-py3"
-                    # Leave only those with ONNX backend
-                    imgs_with_tags = list(
-                        filter(lambda x: re.fullmatch(reg, x.tag or ""), imgs_with_tags)
-                    )
-                return imgs_with_tags
-            except Exception as e:
-                logger.error(f"Unable to fetch image tags for {image}: {e}")
-                return []
+            reg_cl = self._get_registry_client(reg)
+            imgs_with_tags = await reg_cl.list_repo_tags(own, "/".join(repo))
+            # Leave only those with ONNX backend for Triton
+            is_nvcr = image in NVCR_SUPPORTED_IMAGES
+            return [
+                x
+                for x in reversed(imgs_with_tags)  # From older to newer
+                if not is_nvcr or (x.tag and NVCR_ONNX_TAG_RE.fullmatch(x.tag))
+            ]
 
     def deploy_mlflow(self, *args, **kwargs) -> None:  # type: ignore
         return self.run_coroutine(self._deploy_mlflow(*args, **kwargs))
@@ -225,7 +499,12 @@ class InferenceRunner:
             )
         else:
             assert existing_server_info
-            server_config = TritonServerInfo(existing_server_info.job_description)
+            try:
+                server_config = self._get_triton_server_config(existing_server_info)
+                server_config.check_model_repository()
+            except ValueError as e:
+                display_container.error(f"Unable to fetch server config: {e}")
+                return
 
         if not server_config:
             display_container.error("Unable to fetch server config")
@@ -264,39 +543,44 @@ class InferenceRunner:
             f"Deploying {model.name}:{model.stage} using MLFlow inference."
         )
         logger.debug(f"Running job with image {image_with_tag}")
-        async with get() as n_client:
+        n_client = await self._get_client()
+        try:
+            stage = (model.stage).lower()
+            job_descr = await n_client.jobs.start(
+                image=image_with_tag,
+                preset_name=preset_name,
+                shm=True,
+                name=deployment_name,
+                env={
+                    "MLFLOW_TRACKING_URI": str(model.link.with_path("")),
+                },
+                entrypoint="/bin/bash",
+                command=(
+                    "-c "
+                    '"source /root/.bashrc && '
+                    f"mlflow models serve -m models:/{model.name}/{stage} "
+                    '--host=0.0.0.0 --port=5000 --env-manager conda"'
+                ),
+                # restart_policy=JobRestartPolicy.ON_FAILURE,
+                http=HTTPPort(5000, requires_auth=enable_auth),
+                tags=self.get_server_tags(InferenceServerType.MLFLOW, model),
+            )
+        except IllegalArgumentError as e:
+            display_container.error(
+                f"Deployment with name {deployment_name} already exists: {e}"
+            )
+        else:
+            display_container.info(f"Created a job {job_descr.id}")
             try:
-                stage = (model.stage).lower()
-                job_descr = await n_client.jobs.start(
-                    image=image_with_tag,
-                    preset_name=preset_name,
-                    shm=True,
-                    name=deployment_name,
-                    env={
-                        "MLFLOW_TRACKING_URI": str(model.link.with_path("")),
-                    },
-                    entrypoint="/bin/bash",
-                    command=(
-                        "-c "
-                        '"source /root/.bashrc && '
-                        f"mlflow models serve -m models:/{model.name}/{stage} "
-                        '--host=0.0.0.0 --port=5000 --env-manager conda"'
-                    ),
-                    # restart_policy=JobRestartPolicy.ON_FAILURE,
-                    http=HTTPPort(5000, requires_auth=enable_auth),
-                    tags=self.get_server_tags(InferenceServerType.MLFLOW, model),
-                )
-            except IllegalArgumentError as e:
+                job_descr = await self._wait_job_ready(job_descr)
+            except asyncio.TimeoutError:
                 display_container.error(
-                    f"Deployment with name {deployment_name} already exists: {e}"
+                    f"Job {job_descr.id} is still pending "
+                    f"after {JOB_PENDING_TIMEOUT} seconds"
                 )
-            else:
-                display_container.info(f"Created a job {job_descr.id}")
-                while job_descr.status.is_pending:
-                    job_descr = await n_client.jobs.status(job_descr.id)
-                    await asyncio.sleep(0.1)
-                display_container.success(f"Started a job {job_descr.id}")
-                # TODO: monitor API is ready
+                return
+            display_container.success(f"Started a job {job_descr.id}")
+            # TODO: monitor API is ready
 
     async def _deploy_triton_server(
         self,
@@ -307,52 +591,68 @@ class InferenceRunner:
         display_container: DeltaGenerator,
         port: int = 8000,
     ) -> TritonServerInfo | None:
-        async with get() as n_client:
-            model_repo_storage = URL(os.environ["TRITON_MODEL_REPO_STORAGE"])
-            model_repo_job = f"{os.environ['TRITON_MODEL_REPO']}/"
-            Path(model_repo_job).mkdir(parents=True, exist_ok=True)
+        n_client = await self._get_client()
+        model_repo_storage = URL(os.environ["TRITON_MODEL_REPO_STORAGE"])
+        model_repo_job = f"{os.environ['TRITON_MODEL_REPO']}/"
+        Path(model_repo_job).mkdir(parents=True, exist_ok=True)
+        try:
+            job_descr = await n_client.jobs.start(
+                image=image_with_tag,
+                preset_name=preset_name,
+                shm=True,
+                name=server_name,
+                env={
+                    "TRITON_MODEL_REPO": model_repo_job,
+                },
+                volumes=[Volume(model_repo_storage, model_repo_job)],
+                command=(
+                    f"/bin/bash -c "
+                    '"tritonserver --model-control-mode=explicit '
+                    "--strict-model-config=false "
+                    f'--model-repository=$TRITON_MODEL_REPO --http-port={port}"'
+                ),
+                # restart_policy=JobRestartPolicy.ON_FAILURE,
+                # HTTP API Triton exposes. Together with HTTP API it exposes
+                #  gRPC (8001) and metrics ports (8002)
+                http=HTTPPort(port, requires_auth=enable_auth),
+                tags=self.get_server_tags(InferenceServerType.TRITON),
+            )
+        except IllegalArgumentError as e:
+            display_container.error(
+                f"Server with name {server_name} already exists: {e}"
+            )
+            return None
+        else:
+            display_container.info(f"Created a job {job_descr.id}")
             try:
-                job_descr = await n_client.jobs.start(
-                    image=image_with_tag,
-                    preset_name=preset_name,
-                    shm=True,
-                    name=server_name,
-                    env={
-                        "TRITON_MODEL_REPO": model_repo_job,
-                    },
-                    volumes=[Volume(model_repo_storage, model_repo_job)],
-                    command=(
-                        f"/bin/bash -c "
-                        '"tritonserver --model-control-mode=explicit '
-                        "--strict-model-config=false "
-                        f'--model-repository=$TRITON_MODEL_REPO --http-port={port}"'
-                    ),
-                    # restart_policy=JobRestartPolicy.ON_FAILURE,
-                    # HTTP API Triton exposes. Together with HTTP API it exposes
-                    #  gRPC (8001) and metrics ports (8002)
-                    http=HTTPPort(port, requires_auth=enable_auth),
-                    tags=self.get_server_tags(InferenceServerType.TRITON),
-                )
-            except IllegalArgumentError as e:
+                job_descr = await self._wait_job_ready(job_descr)
+            except asyncio.TimeoutError:
                 display_container.error(
-                    f"Server with name {server_name} already exists: {e}"
+                    f"Job {job_descr.id} is still pending "
+                    f"after {JOB_PENDING_TIMEOUT} seconds"
                 )
                 return None
-            else:
-                display_container.info(f"Created a job {job_descr.id}")
-                while job_descr.status.is_pending:
-                    job_descr = await n_client.jobs.status(job_descr.id)
-                    await asyncio.sleep(0.1)
-                display_container.success(f"Started a job {job_descr.id}")
-                display_container.info(f"Checking Triton Server health")
-                triton_status = await self.check_triton_server_health(job_descr)
-                if not triton_status:
-                    display_container.error("Triton server is not ready")
-                    return None
-                display_container.success(f"Triton server is ready")
+            display_container.success(f"Started a job {job_descr.id}")
+            display_container.info(f"Checking Triton Server health")
+            triton_status = await self.check_triton_server_health(job_descr)
+            if not triton_status:
+                display_container.error("Triton server is not ready")
+                return None
+            display_container.success(f"Triton server is ready")
 
+            try:
                 server_config = TritonServerInfo(job_descr)
-                return server_config
+                await asyncio.to_thread(server_config.check_model_repository)
+            except ValueError as e:
+                display_container.error(str(e))
+                return None
+            return server_config
+
+    async def _wait_job_ready(self, job_descr: JobDescription) -> JobDescription:
+        # Bounded, so that a job stuck in pending does not hang the page forever
+        return await asyncio.wait_for(
+            self._job_waiter.wait(job_descr), JOB_PENDING_TIMEOUT
+        )
 
     async def check_triton_server_health(self, job_descr: JobDescription) -> bool:
         triton_url = URL(str(job_descr.internal_hostname_named))
@@ -376,7 +676,42 @@ class InferenceRunner:
         return triton_status
 
     def run_coroutine(self, coro: Coroutine[Any, Any, Any]) -> Any:
-        return asyncio.run(coro)
+        # Coroutines run on a long-lived event loop, so that connections
+        # and other loop-bound resources survive between calls
+        loop, loop_thread = self._get_event_loop()
+        # The loop thread writes to Streamlit containers on behalf of the caller.
+        # Detached afterwards: the context holds the session state, which holds
+        # the runner, and a live thread would keep the runner from being collected.
+        add_script_run_ctx(loop_thread)
+        try:
+            return asyncio.run_coroutine_threadsafe(coro, loop).result()
+        finally:
+            setattr(loop_thread, SCRIPT_RUN_CONTEXT_ATTR_NAME, None)
+
+    def _get_event_loop(self) -> tuple[asyncio.AbstractEventLoop, threading.Thread]:
+        if self._loop is None or self._loop_thread is None:
+            self._loop = asyncio.new_event_loop()
+            self._loop_thread = threading.Thread(
+                target=_run_event_loop,
+                args=(self._loop,),
+                name="inference-runner-loop",
+                daemon=True,
+            )
+            self._loop_thread.start()
+            # Also runs at interpreter exit
+            self._finalizer = weakref.finalize(
+                self,
+                _stop_event_loop,
+                self._loop,
+                self._loop_thread,
+                self._closeables,
+            )
+        return self._loop, self._loop_thread
+
+    def close(self) -> None:
+        if self._finalizer is not None:
+            self._finalizer()
+        self._reset_loop_state()
 
     def list_all_deployed_models(self) -> list[DeployedModelInfo]:
         return self.run_coroutine(self.list_deployed_models())
@@ -389,18 +724,47 @@ class InferenceRunner:
             server_types = [
                 x for x in InferenceServerType if x != InferenceServerType.NONE
             ]
-        for server_type in server_types:
-            server_infos = await self._list_active_inference_servers(server_type)
+        # Server listings and Triton model listings are independent
+        # round-trips, so they are issued concurrently
+        server_infos_per_type = await asyncio.gather(
+            *(
+                self._list_active_inference_servers(server_type)
+                for server_type in server_types
+            )
+        )
+        triton_servers = []
+        seen_servers: set[InferenceServerInfo] = set()
+        for server_infos in server_infos_per_type:
             for server_info in server_infos:
+                if server_info in seen_servers:
+                    continue
+                seen_servers.add(server_info)
                 if server_info.type == InferenceServerType.MLFLOW:
+                    # parsed from job tags, no I/O involved
                     result.append(self.get_mlflow_model_info(server_info))
                 elif server_info.type == InferenceServerType.TRITON:
-                    result.extend(self.get_triton_model_infos(server_info))
+                    triton_servers.append(server_info)
+        triton_model_infos = await asyncio.gather(
+            *(self._list_triton_models(server_info) for server_info in triton_servers)
+        )
+        for model_infos in triton_model_infos:
+            result.extend(model_infos)
         return result
 
+    async def _list_triton_models(
+        self, server_info: InferenceServerInfo
+    ) -> list[DeployedModelInfo]:
+        # MLflow deployment client is synchronous, so run it in a worker thread
+        try:
+            return await asyncio.to_thread(self.get_triton_model_infos, server_info)
+        except ValueError as e:
+            # e.g. model repository is not reachable, skip just this server
+            logger.warning(f"Unable to fetch server config: {e}")
+            return []
+
     def kill_server(self, server: InferenceServerInfo) -> None:
         return self.run_coroutine(self._kill_server(server))
 
     async def _kill_server(self, server: InferenceServerInfo) -> None:
-        async with get() as n_client:
-            await n_client.jobs.kill(server.job_id)
+        n_client = await self._get_client()
+        await n_client.jobs.kill(server.job_id)
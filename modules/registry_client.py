@@ -1,25 +1,59 @@
 from __future__ import annotations
 
+import asyncio
+import time
+
 import aiohttp
+import orjson
 from apolo_sdk import RemoteImage
 from yarl import URL
 
 
+ANON_TOKEN_TTL = 300  # seconds
+
+
 class RegistryV2Client:
+    # Anonymous pull tokens per (registry host, owner, repo), shared by all clients
+    _anon_tokens: dict[tuple[str, str, str], tuple[float, str]] = {}
+
     def __init__(
         self, token: str | None = None, base_url: URL = URL("https://ghcr.io/")
     ) -> None:
         self._base_url = base_url
         self._token = token
+        self._session: aiohttp.ClientSession | None = None
+        self._inflight_tokens: dict[tuple[str, str, str], asyncio.Task[str]] = {}
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        # One session per registry, so that token and tag requests
+        # reuse the same keep-alive connections
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=32, ttl_dns_cache=300, keepalive_timeout=60
+                )
+            )
+        return self._session
+
+    async def close(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
 
     async def list_repo_tags(self, owner: str, repo: str) -> list[RemoteImage]:
-        headers = await self.repo_headers(owner, repo)
         url = self._base_url / "v2" / owner / repo / "tags" / "list"
         res = []
-        async with aiohttp.ClientSession() as cl:
-            async with cl.get(url, headers=headers) as resp:
+        session = await self._get_session()
+        for attempt in range(2):
+            headers = await self.repo_headers(owner, repo)
+            async with session.get(url, headers=headers) as resp:
+                if resp.status == 401 and not self._token and attempt == 0:
+                    # cached anonymous token has expired earlier than expected
+                    self._anon_tokens.pop(self._token_key(owner, repo), None)
+                    continue
                 resp.raise_for_status()
-                resp_json = await resp.json()
+                resp_json = orjson.loads(await resp.read())
+                break
 
         for tag in resp_json["tags"]:
             res.append(RemoteImage(f"{self._base_url.host}/{owner}/{repo}", tag=tag))
@@ -30,15 +64,34 @@ class RegistryV2Client:
         return {"Authorization": f"Bearer {token}"}
 
     async def get_repo_anon_pull_token(self, owner: str, repo: str) -> str:
-        async with aiohttp.ClientSession() as cl:
-            # this is dirty, I didnt investigate further, but nvidia registry exposes
-            # token endpoint at `proxy_auth`
-            if self._base_url.host == "nvcr.io":
-                url = self._base_url / "proxy_auth"
-            else:
-                url = self._base_url / "token"
-            url = url.with_query({"scope": f"repository:{owner}/{repo}:pull"})
-            async with cl.get(url) as resp:
-                resp.raise_for_status()
-                resp_json = await resp.json()
-                return resp_json["token"]
+        key = self._token_key(owner, repo)
+        cached = self._anon_tokens.get(key)
+        if cached is not None and time.monotonic() - cached[0] < ANON_TOKEN_TTL:
+            return cached[1]
+
+        # Concurrent callers for the same repo share a single token request
+        task = self._inflight_tokens.get(key)
+        if task is None:
+            task = asyncio.create_task(self._fetch_anon_pull_token(owner, repo))
+            self._inflight_tokens[key] = task
+            task.add_done_callback(lambda _: self._inflight_tokens.pop(key, None))
+        return await asyncio.shield(task)
+
+    async def _fetch_anon_pull_token(self, owner: str, repo: str) -> str:
+        session = await self._get_session()
+        # this is dirty, I didnt investigate further, but nvidia registry exposes
+        # token endpoint at `proxy_auth`
+        if self._base_url.host == "nvcr.io":
+            url = self._base_url / "proxy_auth"
+        else:
+            url = self._base_url / "token"
+        url = url.with_query({"scope": f"repository:{owner}/{repo}:pull"})
+        async with session.get(url) as resp:
+            resp.raise_for_status()
+            resp_json = orjson.loads(await resp.read())
+            token = resp_json["token"]
+        self._anon_tokens[self._token_key(owner, repo)] = (time.monotonic(), token)
+        return token
+
+    def _token_key(self, owner: str, repo: str) -> tuple[str, str, str]:
+        return (self._base_url.host or "", owner, repo)
@@ -2,16 +2,26 @@ from __future__ import annotations
 
 import datetime as dt
 from collections import OrderedDict
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Sequence
 
 from apolo_sdk import JobDescription
 from yarl import URL
 
 
-@dataclass(frozen=True)
+_JOB_URL_FMT = "https://app.neu.ro/job-details/{}".format
+_DEPLOYMENT_NAME_TRANSLATION = str.maketrans("/_", "--")
+
+
+@lru_cache(maxsize=1024)
+def _default_deployment_name(model_name: str, model_stage: str) -> str:
+    return f"{model_name}-{model_stage}".lower().translate(_DEPLOYMENT_NAME_TRANSLATION)
+
+
+@dataclass(frozen=True, slots=True)
 class ModelStage:
     name: str
     version: str
@@ -25,6 +35,9 @@ class ModelStage:
         str, Any
     ] | None = None  # https://mlflow.org/docs/latest/models.html#mlmodel-file
 
+    def get_default_deployment_name(self) -> str:
+        return _default_deployment_name(self.name, self.stage)
+
     def supports_triton(self) -> bool:
         if not self.mlmodel_definition:
             return False
@@ -42,7 +55,7 @@ class ModelStage:
         raise ValueError("Model does not support Triton")
 
 
-@dataclass
+@dataclass(slots=True)
 class ModelInfo:
     # todo: merge with ModelStage
     name: str
@@ -50,14 +63,16 @@ class ModelInfo:
     version: str
 
 
-@dataclass
+@dataclass(slots=True)
 class DeployedModelInfo:
     model_info: ModelInfo
     inference_server_info: InferenceServerInfo
 
     @staticmethod
+    @lru_cache(maxsize=1)
     def get_md_columns_width() -> OrderedDict[str, int]:
         # Here we set number of columns to show and their relative width
+        # (static, so built once; callers must not modify the result)
         result = OrderedDict()
         result["Model Name:Stage:Version"] = 5
         result["Server Type"] = 2
@@ -66,23 +81,18 @@ class DeployedModelInfo:
         result["Endpoint URL"] = 10
         return result
 
-    def get_md_repr(self) -> dict[str, str]:
+    def get_table_repr(self) -> dict[str, str]:
+        # Links are plain URLs, rendered by link columns of the table
+        model_info = self.model_info
+        server_info = self.inference_server_info
         return {
             "Model Name:Stage:Version": (
-                f"{self.model_info.name}:"
-                f"{self.model_info.stage}:"
-                f"{self.model_info.version}"
-            ),
-            "Server Type": self.inference_server_info.type.value,
-            "Server Job ID": (
-                f"[{self.inference_server_info.job_id}]"
-                f"(https://app.neu.ro/job-details/{self.inference_server_info.job_id})"
-            ),
-            "Creation date": self.inference_server_info.creation_date_str,
-            "Endpoint URL": (
-                f"[{self.inference_server_info.http_url}]"
-                f"({self.inference_server_info.http_url})"
+                f"{model_info.name}:{model_info.stage}:{model_info.version}"
             ),
+            "Server Type": server_info.type.value,
+            "Server Job ID": _JOB_URL_FMT(server_info.job_id),
+            "Creation date": server_info.creation_date_str,
+            "Endpoint URL": str(server_info.http_url),
         }
 
 
@@ -93,7 +103,7 @@ class InferenceServerType(Enum):
     # BENTOML = "bentoml"
 
 
-@dataclass
+@dataclass(frozen=True, eq=False)
 class InferenceServerInfo:
     job_description: JobDescription
     type: InferenceServerType
@@ -104,23 +114,34 @@ class InferenceServerInfo:
             and self.job_description.id == other.job_description.id
         )
 
-    @property
+    def __hash__(self) -> int:
+        # consistent with __eq__, servers are identified by their job
+        return hash(self.job_description.id)
+
+    @cached_property
     def job_name(self) -> str:
         return self.job_description.name or "<no-name>"
 
-    @property
-    def job_tags(self) -> list[str]:
-        return list(self.job_description.tags)
+    @cached_property
+    def job_tags(self) -> Sequence[str]:
+        return self.job_description.tags
 
-    @property
+    @cached_property
+    def tag_map(self) -> dict[str, str]:
+        # Tags are in the form <key>::<value>, parsed once for all lookups
+        return dict(
+            tag.split("::", 1) for tag in self.job_description.tags if "::" in tag
+        )
+
+    @cached_property
     def http_url(self) -> URL:
         return self.job_description.http_url
 
-    @property
+    @cached_property
     def job_id(self) -> str:
         return self.job_description.id
 
-    @property
+    @cached_property
     def creation_date_str(self) -> str:
         if self.job_description.history.created_at:
             return self.job_description.history.created_at.strftime("%D %T")
@@ -128,8 +149,10 @@ class InferenceServerInfo:
             return ""
 
     @staticmethod
+    @lru_cache(maxsize=1)
     def get_md_columns_width() -> OrderedDict[str, int]:
         # Here we set number of columns to show and their relative width
+        # (static, so built once; callers must not modify the result)
         result = OrderedDict()
         result["Server name"] = 4
         result["Job ID"] = 6
@@ -139,31 +162,51 @@ class InferenceServerInfo:
         result["Creation date"] = 4
         return result
 
-    def get_md_repr(self) -> dict[str, str]:
-        result = {
-            "Server name": self.job_description.name or "",
-            "Job ID": (
-                f"[{self.job_description.id}]"
-                f"(https://app.neu.ro/job-details/{self.job_description.id})"
-            ),
+    def get_table_repr(self) -> dict[str, str]:
+        job_description = self.job_description
+        return {
+            "Server name": job_description.name or "",
+            "Job ID": _JOB_URL_FMT(job_description.id),
             "Server Type": self.type.value,
-            "Preset": self.job_description.preset_name or "",
-            "Owner": self.job_description.owner,
+            "Preset": job_description.preset_name or "",
+            "Owner": job_description.owner,
             "Creation date": self.creation_date_str,
         }
-        return result
 
 
-@dataclass
+@dataclass(frozen=True, eq=False)
 class TritonServerInfo(InferenceServerInfo):
-    type: InferenceServerType = InferenceServerType.TRITON
+    type: InferenceServerType = field(default=InferenceServerType.TRITON)
+
+    def __post_init__(self) -> None:
+        # Tricky one, model_repository_path
+        # should be shared between
+        # the machine where the deployment is triggered
+        # and the Triton server machine
+        # This is because to deploy model in Triton, one should
+        # (1) copy its files to triton server (no API exposed for that)
+        # (2) trigger model load via triton server API
+        # Only the configuration is checked here, servers are listed
+        # on the event loop, so the path is checked by check_model_repository
+        if "TRITON_MODEL_REPO" not in self.job_description.container.env:
+            raise ValueError(
+                f"Triton model repository is not configured for server {self.job_id}"
+            )
+
+    def check_model_repository(self) -> None:
+        # Filesystem I/O, call it off the event loop
+        if not self.model_repository_exists:
+            raise ValueError(
+                f"Triton model repository {self.model_repository_path} "
+                f"is not available for server {self.job_id}"
+            )
 
     @property
     def port(self) -> int:
         # port where triton management API is running
         return self.job_description.container.http.port  # type: ignore
 
-    @property
+    @cached_property
     def internal_hostname(self) -> str:
         # we might support external HTTP API later, when auth gets supported
         result = (
@@ -173,10 +216,15 @@ class TritonServerInfo(InferenceServerInfo):
         assert result
         return result
 
-    @property
+    @cached_property
     def public_hostname(self) -> str:
         return str(self.job_description.http_url)
 
-    @property
+    @cached_property
     def model_repository_path(self) -> Path:
         return Path(self.job_description.container.env["TRITON_MODEL_REPO"])
+
+    @cached_property
+    def model_repository_exists(self) -> bool:
+        # Checked once per server config rather than on every deploy / list call
+        return self.model_repository_path.exists()
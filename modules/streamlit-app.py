@@ -1,13 +1,20 @@
 from __future__ import annotations
 
-from typing import Any
+import asyncio
+from typing import Any, Literal, Mapping, Sequence
 
 import streamlit as st
 from apolo_sdk import RemoteImage
 from streamlit.delta_generator import DeltaGenerator
+from streamlit.elements.lib.column_types import ColumnConfig
 
 from modules.mlflow_connector import MLFlowConnector
-from modules.platform_connector import InferenceRunner, InferenceServerType
+from modules.platform_connector import (
+    GH_SUPPORTED_IMAGES,
+    NVCR_SUPPORTED_IMAGES,
+    InferenceRunner,
+    InferenceServerType,
+)
 from modules.resources import DeployedModelInfo, InferenceServerInfo, ModelStage
 from modules.version import __version__ as app_ver
 
@@ -28,56 +35,156 @@ st.set_page_config(
 )
 st.header("In-job model deployments")
 
+REFRESH_TTL = 30  # seconds
+REGISTRY_ETAG_TTL = 5  # seconds
+
+
+# Streamlit reruns the whole script on every widget interaction,
+# so remote listings are served from short-lived caches between reruns.
+# Version changes are picked up early through the registry etag, while
+# removed registered models do not change it and expire with the TTL.
+@st.cache_data(ttl=REGISTRY_ETAG_TTL, show_spinner=False)
+def cached_registry_etag(_mlflow_conn: MLFlowConnector) -> str:
+    return _mlflow_conn.get_registry_etag()
+
+
+@st.cache_data(ttl=REFRESH_TTL, max_entries=8, show_spinner=False)
+def cached_registered_models(
+    _mlflow_conn: MLFlowConnector, registry_etag: str
+) -> list[ModelStage]:
+    return _mlflow_conn.get_registered_models()
+
+
+# Job descriptions are returned as is rather than pickled copies
+@st.cache_resource(ttl=REFRESH_TTL, show_spinner=False)
+def cached_deployed_models(_inf_runner: InferenceRunner) -> list[DeployedModelInfo]:
+    return _inf_runner.list_all_deployed_models()
+
+
+@st.cache_resource(ttl=REFRESH_TTL, show_spinner=False)
+def cached_active_servers(_inf_runner: InferenceRunner) -> list[InferenceServerInfo]:
+    return _inf_runner.list_active_inference_servers()
+
+
+def clear_cached_deployments() -> None:
+    cached_deployed_models.clear()  # type: ignore[attr-defined]
+    cached_active_servers.clear()  # type: ignore[attr-defined]
+
+
+def clear_cached_listings() -> None:
+    cached_registry_etag.clear()  # type: ignore[attr-defined]
+    cached_registered_models.clear()  # type: ignore[attr-defined]
+    inf_runner.clear_cache()
+    clear_cached_deployments()
+
+
+def kill_servers(servers: list[InferenceServerInfo]) -> None:
+    for server in servers:
+        inf_runner.kill_server(server)
+    clear_cached_deployments()
+
+
+def deploy_mlflow(**kwargs: Any) -> None:
+    inf_runner.deploy_mlflow(**kwargs)
+    clear_cached_deployments()
+
+
+def deploy_triton(**kwargs: Any) -> None:
+    inf_runner.deploy_triton(**kwargs)
+    clear_cached_deployments()
+
+
+st.button("Refresh", on_click=clear_cached_listings)
+
 # Communication
 if "mlflow_connector" not in st.session_state:
     print("Not in session state")
     st.session_state["mlflow_connector"] = MLFlowConnector()
 mlflow_conn = st.session_state["mlflow_connector"]  # MLFlowConnector()
-inf_runner = InferenceRunner(
-    mlflow_connector=mlflow_conn,
-)
+# The runner owns the event loop and platform client,
+# kept per session so that connections survive reruns
+session_runner: InferenceRunner | None = st.session_state.get("inference_runner")
+if session_runner is not None and session_runner.mlflow_connector is mlflow_conn:
+    inf_runner = session_runner
+else:
+    if session_runner is not None:
+        session_runner.close()  # built for a connector that was replaced
+    inf_runner = InferenceRunner(
+        mlflow_connector=mlflow_conn,
+    )
+    st.session_state["inference_runner"] = inf_runner
 
 # MLFlow registry
 models_table = st.container()
 models_table.subheader("MLFlow registry")
-models = mlflow_conn.get_registered_models()
-col1, col2, col3, col4, col5 = models_table.columns([5, 5, 3, 10, 20])
-with col1:
-    col1.caption("Model name")
-with col2:
-    col2.caption("Stage")
-with col3:
-    col3.caption("Version")
-with col4:
-    col4.caption("Creation date")
-with col5:
-    col5.caption("Deployment")
+models = cached_registered_models(mlflow_conn, cached_registry_etag(mlflow_conn))
+# Listed once per rerun for both the deployment form and the servers tab
+active_servers = cached_active_servers(inf_runner)
+
 
 # preloading options
-if "image_list_mlflow" not in st.session_state:
-    st.session_state["image_list_mlflow"] = inf_runner.run_coroutine(
-        inf_runner.list_images(github=True, platform=True)
-    )
-if "image_list_triton" not in st.session_state:
-    st.session_state["image_list_triton"] = inf_runner.run_coroutine(
-        inf_runner.list_images(triton=True, platform=True)
+async def list_deployment_options() -> tuple[
+    tuple[str, ...], list[RemoteImage], list[RemoteImage], dict[str, list[RemoteImage]]
+]:
+    # Fetched concurrently in one round and shared by both server types.
+    # Tags are preloaded only for the known server images: platform images
+    # can be many, so their tags are fetched once one of them is selected.
+    server_images = [*GH_SUPPORTED_IMAGES, *NVCR_SUPPORTED_IMAGES]
+    (
+        presets,
+        image_list_mlflow,
+        image_list_triton,
+    ), server_images_tags = await asyncio.gather(
+        asyncio.gather(
+            inf_runner.list_preset_names(),
+            inf_runner.list_images(github=True, platform=True),
+            inf_runner.list_images(triton=True, platform=True),
+        ),
+        asyncio.gather(*(inf_runner.list_image_tags(image) for image in server_images)),
     )
-if "image_tags" not in st.session_state:
-    st.session_state["image_tags"] = {}
-if "presets" not in st.session_state:
-    st.session_state["presets"] = inf_runner.run_coroutine(
-        inf_runner.list_preset_names()
+    return (
+        presets,
+        image_list_mlflow,
+        image_list_triton,
+        {
+            str(image): image_tags
+            for image, image_tags in zip(server_images, server_images_tags)
+        },
     )
 
 
-def deployment_column_entity(model: ModelStage, column: DeltaGenerator) -> None:
-    expander: DeltaGenerator = column.expander("Create new deployment")
+def get_image_tags(
+    image: RemoteImage | None, images_tags: Mapping[str, list[RemoteImage]]
+) -> list[RemoteImage]:
+    if image is None:
+        return []
+    if (image_tags := images_tags.get(str(image))) is not None:
+        return image_tags
+    return inf_runner.run_coroutine(inf_runner.list_image_tags(image))
+
+
+def deployment_column_entity(
+    model: ModelStage,
+    column: DeltaGenerator,
+    presets: Sequence[str],
+    image_list_mlflow: Sequence[RemoteImage],
+    image_list_triton: Sequence[RemoteImage],
+    images_tags: Mapping[str, list[RemoteImage]],
+    triton_servers: Sequence[InferenceServerInfo],
+) -> None:
+    expander: DeltaGenerator = column.expander(
+        f"Create new deployment of {model.name}:{model.stage}", expanded=True
+    )
+    # MLmodel definition is only needed for the model being deployed
+    model = mlflow_conn.load_model_config(model)
+    # Short and stable, unlike the model repr which includes the definition
+    model_key = f"{model.name}:{model.stage}:{model.version}"
 
     deployment_name = expander.text_input(
         "Deployment name",
-        value=f"{model.name}-{model.stage}".lower().replace("/", "-").replace("_", "-"),
+        value=model.get_default_deployment_name(),
         max_chars=40,
-        key="Deployment name:" + str(model),
+        key="Deployment name:" + model_key,
         help=(
             "Deployment name will be embedded to the resulting model URL. \n"
             "The name can only contain lowercase letters, numbers"
@@ -95,7 +202,7 @@ def deployment_column_entity(model: ModelStage, column: DeltaGenerator) -> None:
                 for x in InferenceServerType
                 if x == InferenceServerType.MLFLOW or model.supports_triton()
             ],
-            key="Server type:" + str(model),
+            key="Server type:" + model_key,
         )
     )
     preset_name: str | None = None
@@ -105,35 +212,33 @@ def deployment_column_entity(model: ModelStage, column: DeltaGenerator) -> None:
     if server_type == InferenceServerType.MLFLOW:
         preset_name = expander.selectbox(
             "Preset",
-            options=inf_runner.run_coroutine(inf_runner.list_preset_names()),
-            key="Preset:" + str(model),
+            options=presets,
+            key="Preset:" + model_key,
         )
         image_name: Any = expander.selectbox(
             "Image name",
-            options=st.session_state["image_list_mlflow"],
-            key="Image name:" + str(model),
+            options=image_list_mlflow,
+            key="Image name:" + model_key,
             help="""Image should contain mlflow[extras]>=1.27.0 and conda
             accessible on PATH in order for mlflow serve to work properly""",
         )
-        if not (image_tag := st.session_state["image_tags"].get(image_name)):
-            image_tag = inf_runner.run_coroutine(inf_runner.list_image_tags(image_name))
-            st.session_state["image_tags"]["image_name"] = image_tag
+        image_tag = get_image_tags(image_name, images_tags)
         image_with_tag = expander.selectbox(
             "Image tag",
             options=image_tag,
-            key="Image tag:" + str(model),
+            key="Image tag:" + model_key,
             format_func=lambda x: x.tag,
         )
         enable_auth = expander.radio(
             "Force platform Auth",
             options=[True, False],
             horizontal=True,
-            key="Force platform Auth:" + str(model),
+            key="Force platform Auth:" + model_key,
         )
         expander.button(
             "Deploy",
-            key="Deploy:" + str(model),
-            on_click=inf_runner.deploy_mlflow,
+            key="Deploy:" + model_key,
+            on_click=deploy_mlflow,
             kwargs={
                 "model": model,
                 "deployment_name": deployment_name,
@@ -150,79 +255,69 @@ def deployment_column_entity(model: ModelStage, column: DeltaGenerator) -> None:
             "We can not verify this automatically yet."
         )
         create_server = expander.radio(
-            "Create new server instance", options=[False, True], horizontal=True
+            "Create new server instance",
+            options=[False, True],
+            horizontal=True,
+            key="Create new server instance:" + model_key,
         )
         server_name: str | None = None
         existing_server_info: InferenceServerInfo | None = None
-        triton_servers: list[InferenceServerInfo]
 
         if create_server:
             server_name = expander.text_input(
-                "New server name", value="triton", max_chars=40
+                "New server name",
+                value="triton",
+                max_chars=40,
+                key="New server name:" + model_key,
             )
             preset_name = expander.selectbox(
                 "Preset",
-                options=st.session_state["presets"],
-                key="Preset:" + str(model),
+                options=presets,
+                key="Preset:" + model_key,
             )
             image_name = expander.selectbox(
                 "Image name",
-                options=st.session_state["image_list_triton"],
+                options=image_list_triton,
+                key="Triton image name:" + model_key,
                 help="Image with Triton server should contain ONNX inference backend",
             )
-            if not (image_tag := st.session_state["image_tags"].get(image_name)):
-                image_tag = inf_runner.run_coroutine(
-                    inf_runner.list_image_tags(image_name)
-                )
-                st.session_state["image_tags"]["image_name"] = image_tag
+            image_tag = get_image_tags(image_name, images_tags)
             image_with_tag = expander.selectbox(
                 "Image tag",
                 options=image_tag,
-                key="Image tag:" + str(model),
+                key="Triton image tag:" + model_key,
                 format_func=lambda x: x.tag,
             )
             enable_auth = expander.radio(
                 "Force platform Auth",
-                options=[True, False],  # key=str(model)
+                options=[True, False],
+                key="Triton force platform Auth:" + model_key,
             )
         else:
-            triton_servers = [
-                x
-                for x in inf_runner.list_active_inference_servers()
-                if x.type == InferenceServerType.TRITON
-            ]
             existing_server_info = expander.selectbox(
                 "Select existing server",
                 options=triton_servers,
+                key="Select existing server:" + model_key,
                 format_func=lambda x: f"{x.job_name}:{x.job_id}",
             )
 
         # done with config, validating and allowing to deploy
-        input_is_valid = any(
+        input_is_valid = bool(
+            # deploying to the new triton server
             (
-                # deploying to the new triton server
-                all(
-                    (
-                        create_server is True,
-                        preset_name,
-                        enable_auth is not None,
-                        image_with_tag,
-                    )
-                ),
-                # deploying to existing server
-                all(
-                    (
-                        create_server is False,
-                        existing_server_info is not None,
-                    )
-                ),
+                create_server
+                and preset_name
+                and enable_auth is not None
+                and image_with_tag
             )
+            # deploying to existing server
+            or (not create_server and existing_server_info is not None)
         )
 
         expander.button(
             "Deploy",
-            key="Deploy:" + str(model),
-            on_click=inf_runner.deploy_triton,
+            key="Deploy:" + model_key,
+            on_click=deploy_triton,
             kwargs={
                 "display_container": expander,
                 "model": model,
@@ -238,65 +333,132 @@ def deployment_column_entity(model: ModelStage, column: DeltaGenerator) -> None:
         )
 
 
-for model in models:
-    with col1:
-        col1.write(
-            ""
-        )  # https://github.com/streamlit/streamlit/issues/3052#issuecomment-1083620133
-        col1.write(f"[{model.name}]({model.public_link})")
-        col1.write("")
-    with col2:
-        col2.write("")
-        col2.write(f"{model.stage}")
-        col2.write("")
-    with col3:
-        col3.write("")
-        col3.text(f"{model.version}")
-        col3.write("")
-    with col4:
-        col4.write("")
-        col4.text(f'{model.creation_datetime.strftime("%D %T")}')
-        col4.write("")
-    with col5:
-        deployment_column_entity(model, col5)
+# A single table delta instead of a widget per cell,
+# the deployment form is shown for the selected model only
+registry_selection = models_table.dataframe(
+    {
+        "Model name": [str(model.public_link) for model in models],
+        "Stage": [model.stage for model in models],
+        "Version": [model.version for model in models],
+        "Creation date": [
+            model.creation_datetime.strftime("%D %T") for model in models
+        ],
+    },
+    hide_index=True,
+    use_container_width=True,
+    column_config={
+        "Model name": st.column_config.LinkColumn(
+            display_text=r"#/models/(.+)/versions/"
+        ),
+    },
+    key="registry_table",
+    on_select="rerun",
+    selection_mode="single-row",
+)
+if selected_rows := registry_selection["selection"]["rows"]:
+    (
+        presets,
+        image_list_mlflow,
+        image_list_triton,
+        images_tags,
+    ) = inf_runner.run_coroutine(list_deployment_options())
+    deployment_column_entity(
+        models[selected_rows[0]],
+        models_table,
+        presets,
+        image_list_mlflow,
+        image_list_triton,
+        images_tags,
+        [x for x in active_servers if x.type == InferenceServerType.TRITON],
+    )
+else:
+    models_table.caption("Select a model to create a new deployment")
 
 # Deployments information
 deployments_info = st.container()
 deployments_info.subheader("Deployments information")
 tab_names = ["Deployed models", "Inference servers"]
-models_tab, servers_tab = deployments_info.tabs(tab_names)
-
-# Models tab
-deployed_models = inf_runner.list_all_deployed_models()
-model_column_names = DeployedModelInfo.get_md_columns_width().keys()
-model_column_widths = DeployedModelInfo.get_md_columns_width().values()
-model_columns: list[DeltaGenerator] = models_tab.columns(list(model_column_widths))
-
-for column_name, column in zip(model_column_names, model_columns):
-    column.caption(column_name)
-for deployed_model in deployed_models:
-    model_repr = deployed_model.get_md_repr()
-    for column_name, column in zip(model_column_names, model_columns):
-        column.write(model_repr[column_name])
-
-# Servers tab
-active_servers = inf_runner.list_active_inference_servers()
-server_column_names = InferenceServerInfo.get_md_columns_width().keys()
-server_column_widths = list(InferenceServerInfo.get_md_columns_width().values())
-server_column_widths += [3]  # kill button
-server_columns: list[DeltaGenerator] = servers_tab.columns(server_column_widths)
-
-for column_name, column in zip(server_column_names, server_columns):
-    column.caption(column_name)
-server_columns[-1].caption("Terminate server")
-
-for server in active_servers:
-    server_repr = server.get_md_repr()
-    for column_name, column in zip(server_column_names, server_columns):
-        column.write(server_repr[column_name])
-    server_columns[-1].button(
-        "Terminate",
-        key=str(server),
-        on_click=inf_runner.kill_server,
-        args=(server,),
+# st.tabs renders the content of every tab, so a segmented control
+# is used instead to render, and fetch, only the selected one
+active_tab = (
+    deployments_info.segmented_control(
+        "Deployments view",
+        options=tab_names,
+        default=tab_names[0],
+        key="deployments_view",
+        label_visibility="collapsed",
+    )
+    or tab_names[0]  # nothing is selected after a second click on the active tab
+)
+
+
+def column_size(relative_width: int) -> Literal["small", "medium", "large"]:
+    if relative_width <= 3:
+        return "small"
+    return "medium" if relative_width <= 5 else "large"
+
+
+# Table layouts are static, while the script body runs again on every rerun,
+# so they are built once per process
+@st.cache_resource
+def table_column_configs() -> tuple[dict[str, ColumnConfig], dict[str, ColumnConfig]]:
+    job_id_link = st.column_config.LinkColumn(display_text=r"job-details/(.+)$")
+    model_column_config = {
+        name: st.column_config.Column(width=column_size(width))
+        for name, width in DeployedModelInfo.get_md_columns_width().items()
+    }
+    model_column_config["Server Job ID"] = job_id_link
+    model_column_config["Endpoint URL"] = st.column_config.LinkColumn()
+    server_column_config = {
+        name: st.column_config.Column(width=column_size(width))
+        for name, width in InferenceServerInfo.get_md_columns_width().items()
+    }
+    server_column_config["Job ID"] = job_id_link
+    return model_column_config, server_column_config
+
+
+def table_columns(
+    columns_width: Mapping[str, int],
+    rows: Sequence[Mapping[str, str]],
+) -> dict[str, list[str]]:
+    # Column-wise data keeps the header even when there are no rows
+    return {name: [row[name] for row in rows] for name in columns_width}
+
+
+model_column_config, server_column_config = table_column_configs()
+
+if active_tab == tab_names[0]:
+    # Models tab
+    deployed_models = cached_deployed_models(inf_runner)
+    deployments_info.dataframe(
+        table_columns(
+            DeployedModelInfo.get_md_columns_width(),
+            [deployed_model.get_table_repr() for deployed_model in deployed_models],
+        ),
+        hide_index=True,
+        use_container_width=True,
+        column_config=model_column_config,
+    )
+else:
+    # Servers tab
+    servers_selection = deployments_info.dataframe(
+        table_columns(
+            InferenceServerInfo.get_md_columns_width(),
+            [server.get_table_repr() for server in active_servers],
+        ),
+        hide_index=True,
+        use_container_width=True,
+        column_config=server_column_config,
+        key="servers_table",
+        on_select="rerun",
+        selection_mode="multi-row",
+    )
+    selected_servers = [
+        active_servers[row] for row in servers_selection["selection"]["rows"]
+    ]
+    deployments_info.button(
+        "Terminate selected servers",
+        on_click=kill_servers,
+        args=(selected_servers,),
+        disabled=not selected_servers,
     )
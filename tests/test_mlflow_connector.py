@@ -0,0 +1,71 @@
+import threading
+from typing import Any
+from unittest import mock
+
+from modules.mlflow_connector import (
+    TRITON_CLIENTS_PER_THREAD,
+    MLFlowConnector,
+    _get_triton_client,
+)
+
+
+def test_triton_clients_are_not_shared_between_threads() -> None:
+    with mock.patch(
+        "modules.mlflow_connector.get_deploy_client",
+        side_effect=lambda *args: mock.Mock(),
+    ):
+        client = _get_triton_client("http://triton:8000", "/models")
+        assert _get_triton_client("http://triton:8000", "/models") is client
+
+        other_thread_clients: list[Any] = []
+        thread = threading.Thread(
+            target=lambda: other_thread_clients.append(
+                _get_triton_client("http://triton:8000", "/models")
+            )
+        )
+        thread.start()
+        thread.join()
+
+    assert other_thread_clients[0] is not client
+
+
+def test_triton_clients_are_evicted_least_recently_used_first() -> None:
+    def get_client(i: int) -> Any:
+        return _get_triton_client(f"http://triton-{i}:8000", "/models")
+
+    def use_clients() -> None:
+        for i in range(TRITON_CLIENTS_PER_THREAD):
+            get_client(i)
+        get_client(0)  # makes triton-1 the least recently used one
+        get_client(TRITON_CLIENTS_PER_THREAD)  # evicts triton-1
+        get_client(0)
+        get_client(1)
+
+    with mock.patch(
+        "modules.mlflow_connector.get_deploy_client",
+        side_effect=lambda *args: mock.Mock(),
+    ) as get_deploy_client:
+        thread = threading.Thread(target=use_clients)  # starts with no clients
+        thread.start()
+        thread.join()
+
+    # triton-0 is reused, triton-1 is created again
+    assert get_deploy_client.call_count == TRITON_CLIENTS_PER_THREAD + 2
+
+
+def test_registered_model_uri_keeps_model_name_as_is() -> None:
+    model_version = mock.Mock(
+        version="1", current_stage="Staging", creation_timestamp=0, source="s3://m"
+    )
+    model_version.name = "x#y"
+    client = mock.Mock()
+    client._tracking_client.tracking_uri = "http://mlflow"
+    client.search_model_versions.return_value = mock.Mock(
+        __iter__=lambda _: iter([model_version]), token=None
+    )
+    with mock.patch.dict(
+        "os.environ", {"MLFLOW_TRACKING_URI": "http://mlflow"}
+    ), mock.patch("modules.mlflow_connector._get_mlflow_client", return_value=client):
+        (model,) = MLFlowConnector().get_registered_models()
+
+    assert str(model.uri) == "models:/x#y/Staging"
@@ -0,0 +1,137 @@
+import asyncio
+import gc
+import threading
+import weakref
+from typing import Any, AsyncIterator
+from unittest import mock
+
+from apolo_sdk import JobStatus, RemoteImage
+from streamlit.runtime.scriptrunner import add_script_run_ctx
+from streamlit.runtime.scriptrunner_utils.script_run_context import (
+    SCRIPT_RUN_CONTEXT_ATTR_NAME,
+)
+
+from modules.platform_connector import (
+    IMAGE_TAGS_ERROR_CACHE_TTL,
+    InferenceRunner,
+    PendingJobWaiter,
+    _get_cached,
+)
+from modules.resources import ModelInfo
+
+
+def test_inference_runner_is_collected() -> None:
+    runner = InferenceRunner(mlflow_connector=mock.Mock())
+    runner.run_coroutine(asyncio.sleep(0))  # starts the event loop thread
+    loop_thread = runner._loop_thread
+    assert loop_thread is not None
+    runner_ref = weakref.ref(runner)
+
+    del runner
+    gc.collect()
+
+    assert runner_ref() is None
+    loop_thread.join(timeout=5)
+    assert not loop_thread.is_alive()
+
+
+def test_pending_job_waiter_lists_suspended_jobs() -> None:
+    suspended_job = mock.Mock(id="job-1")
+    suspended_job.status = JobStatus.SUSPENDED
+
+    async def list_jobs(**kwargs: Any) -> AsyncIterator[mock.Mock]:
+        if JobStatus.SUSPENDED in kwargs["statuses"]:
+            yield suspended_job
+
+    client = mock.Mock()
+    client.jobs.list = list_jobs
+    client.jobs.status = mock.AsyncMock(return_value=suspended_job)
+
+    async def get_client() -> mock.Mock:
+        return client
+
+    async def resolve() -> None:
+        waiter = PendingJobWaiter(get_client, tags=[])
+        waiter._pending["job-1"] = asyncio.get_running_loop().create_future()
+        await waiter._resolve_started_jobs()
+        assert not waiter._pending["job-1"].done()
+
+    asyncio.run(resolve())
+    client.jobs.status.assert_not_called()
+
+
+def test_dropped_session_runner_closes_its_client() -> None:
+    # Streamlit keeps one runner per session in its session state, which is
+    # also reachable from the script context of the calling thread
+    client = mock.Mock(close=mock.AsyncMock())
+    session_state: dict[str, InferenceRunner] = {}
+    script_thread = threading.current_thread()
+    add_script_run_ctx(script_thread, mock.Mock(session_state=session_state))
+    try:
+        with mock.patch(
+            "modules.platform_connector.get", mock.AsyncMock(return_value=client)
+        ):
+            runner = InferenceRunner(mlflow_connector=mock.Mock())
+            session_state["inference_runner"] = runner
+            runner.run_coroutine(runner._get_client())
+    finally:
+        setattr(script_thread, SCRIPT_RUN_CONTEXT_ATTR_NAME, None)
+    loop_thread = runner._loop_thread
+    assert loop_thread is not None
+
+    del runner, session_state
+    gc.collect()
+
+    loop_thread.join(timeout=5)
+    assert not loop_thread.is_alive()
+    client.close.assert_awaited_once()
+
+
+def test_deployed_models_skip_triton_server_without_model_repo() -> None:
+    mlflow_connector = mock.Mock()
+    mlflow_connector.list_triton_deployments.return_value = [
+        ModelInfo(name="model", stage="Staging", version="unknown")
+    ]
+    runner = InferenceRunner(mlflow_connector=mlflow_connector)
+    broken_job = mock.Mock(id="job-broken", tags=["server-type::Triton"])
+    broken_job.container.env = {}  # no TRITON_MODEL_REPO
+    unmounted_job = mock.Mock(id="job-unmounted", tags=["server-type::Triton"])
+    unmounted_job.container.env = {"TRITON_MODEL_REPO": "/nonexistent/model-repo"}
+    job = mock.Mock(id="job-ok", tags=["server-type::Triton"])
+    job.container.env = {"TRITON_MODEL_REPO": "/"}
+
+    async def list_jobs(**kwargs: Any) -> AsyncIterator[mock.Mock]:
+        for job_descr in (broken_job, unmounted_job, job):
+            yield job_descr
+
+    client = mock.Mock()
+    client.jobs.list = list_jobs
+    with mock.patch(
+        "modules.platform_connector.get", mock.AsyncMock(return_value=client)
+    ):
+        # the model repository is only checked when its models are listed
+        with mock.patch("pathlib.Path.exists") as path_exists:
+            servers = runner.list_active_inference_servers()
+        deployed_models = list(runner.list_all_deployed_models())
+    runner.close()
+
+    assert len(servers) == 3
+    path_exists.assert_not_called()
+    assert [x.inference_server_info.job_id for x in deployed_models] == ["job-ok"]
+
+
+def test_failed_image_tags_listing_is_cached_briefly() -> None:
+    runner = InferenceRunner(mlflow_connector=mock.Mock())
+    image = RemoteImage(name="registry.example.com/owner/failing-image")
+    with mock.patch.object(
+        runner, "_list_image_tags", mock.AsyncMock(side_effect=RuntimeError)
+    ) as list_image_tags:
+        assert runner.run_coroutine(runner.list_image_tags(image)) == []
+        assert runner.run_coroutine(runner.list_image_tags(image)) == []
+        entry = _get_cached(("image_tags", str(image)))
+        runner.clear_cache()
+        assert runner.run_coroutine(runner.list_image_tags(image)) == []
+    runner.close()
+
+    assert entry == (IMAGE_TAGS_ERROR_CACHE_TTL, [])
+    assert list_image_tags.await_count == 2